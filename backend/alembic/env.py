@@ -11,6 +11,7 @@ import sys
 # for 'autogenerate' support
 from app.core.database import Base
 from app.core.config import settings
+import app.models  # noqa: F401  (registers all tables on Base.metadata)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -78,9 +79,9 @@ def run_migrations_online() -> None:
             with context.begin_transaction():
                 context.run_migrations()
     except Exception as e:
-        print(f"Warning: Could not connect to database for migrations: {e}")
-        print("To use migrations, ensure PostgreSQL is running with correct credentials.")
-        print("Skipping migrations - tables will be created automatically on app startup.")
+        print(f"Error: Could not run database migrations: {e}")
+        print("Ensure PostgreSQL is running with correct credentials, then re-run `alembic upgrade head`.")
+        raise
 
 
 if context.is_offline_mode():
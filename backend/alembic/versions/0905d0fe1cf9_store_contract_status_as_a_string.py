@@ -0,0 +1,56 @@
+"""store contract status as a string
+
+Replaces the ``contractstatus`` enum (which stored member names such as
+``DRAFT``) with a ``VARCHAR(32)`` holding the lowercase enum values.
+
+Revision ID: 0905d0fe1cf9
+Revises: 93a12877ff37
+Create Date: 2026-10-14 14:14:31.783613
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0905d0fe1cf9'
+down_revision: Union[str, None] = '93a12877ff37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CONTRACT_STATUSES = (
+    'DRAFT', 'PENDING_REVIEW', 'UNDER_REVIEW', 'APPROVED', 'PENDING_SIGNATURE',
+    'SIGNED', 'ACTIVE', 'EXPIRED', 'TERMINATED', 'REJECTED',
+)
+contract_status_enum = sa.Enum(*CONTRACT_STATUSES, name='contractstatus')
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        op.alter_column(
+            'contracts', 'status',
+            type_=sa.String(32),
+            postgresql_using='lower(status::text)',
+        )
+        contract_status_enum.drop(op.get_bind(), checkfirst=True)
+    else:
+        op.execute("UPDATE contracts SET status = lower(status)")
+        with op.batch_alter_table('contracts') as batch_op:
+            batch_op.alter_column('status', type_=sa.String(32), existing_nullable=False)
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        contract_status_enum.create(op.get_bind(), checkfirst=True)
+        op.alter_column(
+            'contracts', 'status',
+            type_=contract_status_enum,
+            postgresql_using='upper(status)::contractstatus',
+        )
+    else:
+        op.execute("UPDATE contracts SET status = upper(status)")
+        with op.batch_alter_table('contracts') as batch_op:
+            batch_op.alter_column('status', type_=contract_status_enum, existing_nullable=False)
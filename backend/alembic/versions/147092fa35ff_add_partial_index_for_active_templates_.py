@@ -0,0 +1,34 @@
+"""add partial index for active templates by category
+
+Covers ``WHERE is_active AND category = ? ORDER BY id`` in list_templates.
+Built with CREATE INDEX CONCURRENTLY on PostgreSQL (see b38ec38976fb).
+
+Revision ID: 147092fa35ff
+Revises: 6e743c3edfbc
+Create Date: 2026-10-14 14:34:51.440539
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '147092fa35ff'
+down_revision: Union[str, None] = '6e743c3edfbc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_templates_active_category', 'templates', ['category', 'id'], unique=False,
+                        postgresql_where=sa.text('is_active'), sqlite_where=sa.text('is_active = 1'),
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_templates_active_category', table_name='templates',
+                      postgresql_concurrently=True, if_exists=True)
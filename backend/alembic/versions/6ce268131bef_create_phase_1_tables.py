@@ -0,0 +1,96 @@
+"""create phase 1 tables
+
+Schema for users, templates and contracts. Databases that were bootstrapped
+with ``Base.metadata.create_all`` by the original, pre-migration models should
+be marked as migrated with ``alembic stamp 6ce268131bef``; ``setup_db.py``
+now stamps the databases it creates at head instead.
+
+Revision ID: 6ce268131bef
+Revises: 85b5bff65a56
+Create Date: 2026-10-14 14:00:55.076009
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6ce268131bef'
+down_revision: Union[str, None] = '85b5bff65a56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.Column('full_name', sa.String(), nullable=False),
+    sa.Column('hashed_password', sa.String(), nullable=False),
+    sa.Column('role', sa.Enum('PROCUREMENT', 'LEGAL', 'FINANCE', 'ADMIN', name='userrole'), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_table('templates',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('category', sa.String(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('created_by_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['created_by_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_templates_category'), 'templates', ['category'], unique=False)
+    op.create_index(op.f('ix_templates_name'), 'templates', ['name'], unique=False)
+    op.create_table('contracts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('contract_number', sa.String(), nullable=True),
+    sa.Column('status', sa.Enum('DRAFT', 'PENDING_REVIEW', 'UNDER_REVIEW', 'APPROVED', 'PENDING_SIGNATURE', 'SIGNED', 'ACTIVE', 'EXPIRED', 'TERMINATED', 'REJECTED', name='contractstatus'), nullable=False),
+    sa.Column('contract_value', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('currency', sa.String(length=3), nullable=True),
+    sa.Column('start_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('end_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('signature_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('counterparty_name', sa.String(), nullable=False),
+    sa.Column('counterparty_contact', sa.String(), nullable=True),
+    sa.Column('docusign_envelope_id', sa.String(), nullable=True),
+    sa.Column('docusign_status', sa.String(), nullable=True),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('template_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['template_id'], ['templates.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_contracts_contract_number'), 'contracts', ['contract_number'], unique=True)
+    op.create_index(op.f('ix_contracts_docusign_envelope_id'), 'contracts', ['docusign_envelope_id'], unique=True)
+    op.create_index(op.f('ix_contracts_status'), 'contracts', ['status'], unique=False)
+    op.create_index(op.f('ix_contracts_title'), 'contracts', ['title'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_contracts_title'), table_name='contracts')
+    op.drop_index(op.f('ix_contracts_status'), table_name='contracts')
+    op.drop_index(op.f('ix_contracts_docusign_envelope_id'), table_name='contracts')
+    op.drop_index(op.f('ix_contracts_contract_number'), table_name='contracts')
+    op.drop_table('contracts')
+    op.drop_index(op.f('ix_templates_name'), table_name='templates')
+    op.drop_index(op.f('ix_templates_category'), table_name='templates')
+    op.drop_table('templates')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    sa.Enum(name='contractstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='userrole').drop(op.get_bind(), checkfirst=True)
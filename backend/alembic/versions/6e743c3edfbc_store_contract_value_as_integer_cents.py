@@ -0,0 +1,48 @@
+"""store contract value as integer cents
+
+Converts ``contracts.contract_value`` from ``NUMERIC(15, 2)`` to a ``BIGINT``
+number of cents (see ``app.models.types.Cents``).
+
+Revision ID: 6e743c3edfbc
+Revises: 0905d0fe1cf9
+Create Date: 2026-10-14 14:15:42.659792
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e743c3edfbc'
+down_revision: Union[str, None] = '0905d0fe1cf9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        op.alter_column(
+            'contracts', 'contract_value',
+            type_=sa.BigInteger(),
+            postgresql_using='round(contract_value * 100)::bigint',
+        )
+    else:
+        op.execute("UPDATE contracts SET contract_value = CAST(round(contract_value * 100) AS INTEGER)")
+        with op.batch_alter_table('contracts') as batch_op:
+            batch_op.alter_column('contract_value', type_=sa.BigInteger())
+
+
+def downgrade() -> None:
+    numeric = sa.Numeric(precision=15, scale=2)
+    if op.get_context().dialect.name == 'postgresql':
+        op.alter_column(
+            'contracts', 'contract_value',
+            type_=numeric,
+            postgresql_using='contract_value / 100.0',
+        )
+    else:
+        with op.batch_alter_table('contracts') as batch_op:
+            batch_op.alter_column('contract_value', type_=numeric)
+        op.execute("UPDATE contracts SET contract_value = contract_value / 100.0")
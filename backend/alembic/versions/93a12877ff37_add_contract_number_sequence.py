@@ -0,0 +1,32 @@
+"""add contract number sequence
+
+Backs auto-generated ``CT-S`` + 8-digit contract numbers, a format distinct
+from the random ``CT-XXXXXXXX`` (hex) fallback. Skipped on databases without
+sequence support (SQLite), where the application uses that fallback.
+
+Revision ID: 93a12877ff37
+Revises: b38ec38976fb
+Create Date: 2026-10-14 14:06:22.216753
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '93a12877ff37'
+down_revision: Union[str, None] = 'b38ec38976fb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.supports_sequences:
+        op.execute(sa.schema.CreateSequence(sa.Sequence('contract_number_seq')))
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.supports_sequences:
+        op.execute(sa.schema.DropSequence(sa.Sequence('contract_number_seq')))
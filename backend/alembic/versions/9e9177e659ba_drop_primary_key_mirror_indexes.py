@@ -0,0 +1,37 @@
+"""drop primary key mirror indexes
+
+Databases created with ``Base.metadata.create_all`` by the original models
+have ``ix_users_id``, ``ix_templates_id`` and ``ix_contracts_id``, which
+duplicate the primary key indexes; the models no longer declare them and
+6ce268131bef never created them, so the drops are guarded with IF EXISTS.
+Dropped CONCURRENTLY on PostgreSQL (see b38ec38976fb).
+
+Revision ID: 9e9177e659ba
+Revises: 147092fa35ff
+Create Date: 2026-10-14 14:53:50.689152
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e9177e659ba'
+down_revision: Union[str, None] = '147092fa35ff'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in ('users', 'templates', 'contracts'):
+            op.drop_index(f'ix_{table}_id', table_name=table,
+                          postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    # Nothing to restore: the primary key already indexes id, and databases
+    # built by these migrations never had the mirror indexes
+    pass
@@ -0,0 +1,43 @@
+"""add composite contract indexes
+
+Indexes are built with CREATE INDEX CONCURRENTLY on PostgreSQL so writes to
+``contracts`` are not blocked while they build; that statement cannot run in a
+transaction, hence the autocommit blocks.
+
+Revision ID: b38ec38976fb
+Revises: 6ce268131bef
+Create Date: 2026-10-14 14:03:29.942491
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b38ec38976fb'
+down_revision: Union[str, None] = '6ce268131bef'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_contracts_owner_status', 'contracts', ['owner_id', 'status'], unique=False,
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_contracts_status_created', 'contracts', ['status', 'created_at'], unique=False,
+                        postgresql_concurrently=True, if_not_exists=True)
+        # Superseded by ix_contracts_status_created (leading column is status)
+        op.drop_index('ix_contracts_status', table_name='contracts',
+                      postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_contracts_status', 'contracts', ['status'], unique=False,
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_contracts_status_created', table_name='contracts',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_contracts_owner_status', table_name='contracts',
+                      postgresql_concurrently=True, if_exists=True)
@@ -1,19 +1,40 @@
 """
 Database session management
 """
-from sqlalchemy import create_engine
+from sqlalchemy import Column, create_engine
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import declarative_base, sessionmaker
 from .config import settings
 
+
+def _pool_options() -> dict:
+    """Connection pool options for the configured database"""
+    if settings.DATABASE_URL.startswith("sqlite"):
+        # Local SQLite files have no network round-trips; keep SQLAlchemy's defaults
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        # Reuse the most recently returned connection so surplus ones sit idle
+        # and are recycled instead of being kept warm round-robin
+        "pool_use_lifo": True,
+    }
+
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    echo=settings.DEBUG
+    echo=settings.SQL_ECHO,
+    **_pool_options()
 )
 
 # Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Sessions live for a single request, so objects are not expired on commit;
+# that lets handlers return freshly written rows without reloading them.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Create Base class for models
 Base = declarative_base()
@@ -23,9 +44,32 @@ def get_db():
     """
     Dependency function to get database session
     Yields database session and ensures it's closed after use
+
+    Sessions are synchronous: endpoints that use them should be declared with
+    plain ``def`` so FastAPI runs them in its threadpool instead of blocking
+    the event loop on database I/O.
     """
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+def is_unique_violation(exc: IntegrityError, column: Column) -> bool:
+    """
+    Check whether exc was raised by the unique index/constraint on column
+
+    PostgreSQL reports the violated constraint by name; SQLite only names the
+    columns (``UNIQUE constraint failed: users.email``).
+    """
+    table = column.table
+    diag = getattr(exc.orig, "diag", None)
+    if diag is not None and getattr(diag, "constraint_name", None):
+        names = {
+            index.name for index in table.indexes
+            if index.unique and list(index.columns) == [column]
+        }
+        names.add(f"{table.name}_{column.name}_key")
+        return diag.constraint_name in names
+    return f"UNIQUE constraint failed: {table.name}.{column.name}" in str(exc.orig)
@@ -0,0 +1,18 @@
+"""
+Keyset pagination helpers
+"""
+from typing import Sequence
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def next_cursor_headers(rows: Sequence, limit: int) -> dict:
+    """
+    Headers advertising the cursor for the page after rows
+
+    Rows must be ordered by ``id``. A short page means there is nothing left,
+    so the cursor is only sent when the page is full.
+    """
+    if rows and len(rows) == limit:
+        return {NEXT_CURSOR_HEADER: str(rows[-1].id)}
+    return {}
@@ -8,15 +8,29 @@ from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
+from .cache import TTLCache
 from .config import settings
 from .database import get_db
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context. Hashing runs in the request threadpool (the
+# routes that hash are plain ``def``), so it never blocks the event loop.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# Authenticated users by ID, so most requests skip the user lookup.
+# Invalidated on user update/delete in this worker only; elsewhere role and
+# is_active changes can take up to USER_CACHE_TTL_SECONDS to apply.
+user_cache = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against its hash"""
@@ -75,7 +89,7 @@ def decode_access_token(token: str) -> dict:
         raise credentials_exception
 
 
-async def get_current_user(
+def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ):
@@ -105,9 +119,14 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user = user_cache.get(int(user_id))
     if user is None:
-        raise credentials_exception
+        user = db.get(User, int(user_id))
+        if user is None:
+            raise credentials_exception
+        # Detach so the cached instance is never shared between sessions
+        db.expunge(user)
+        user_cache.set(user.id, user)
 
     if not user.is_active:
         raise HTTPException(
@@ -130,8 +149,10 @@ def check_user_role(required_roles: list[str]):
     """
     from ..models.user import User
 
+    allowed_roles = frozenset(required_roles)
+
     async def role_checker(current_user: User = Depends(get_current_user)) -> User:
-        if current_user.role not in required_roles:
+        if current_user.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"User role '{current_user.role}' not authorized. Required: {required_roles}"
@@ -139,3 +160,8 @@ def check_user_role(required_roles: list[str]):
         return current_user
 
     return role_checker
+
+
+# Shared role dependencies, built once so routes reuse the same checker
+require_admin = check_user_role(["admin"])
+require_legal_or_admin = check_user_role(["legal", "admin"])
@@ -1,21 +1,34 @@
 """
 Main FastAPI application
+
+Production entrypoint (run from ``backend/`` after ``alembic upgrade head``)::
+
+    uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers $(nproc) \
+        --loop uvloop --http httptools --limit-concurrency 1000 --timeout-keep-alive 30
+
+uvloop and httptools ship with ``uvicorn[standard]``; passing them explicitly
+makes startup fail loudly instead of silently falling back to the pure-Python
+asyncio loop and h11 parser.
 """
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from .core.config import settings
-from .core.database import engine, Base
+from .core.database import engine
 from .routes import auth_router, users_router, templates_router, contracts_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
-    # Startup: Create database tables (skip in testing)
+    # Startup: the schema is managed by Alembic (`alembic upgrade head` before the
+    # server starts); only open one pooled connection so the first request does
+    # not pay the connect cost (skip in testing)
     import os
     if not os.getenv("TESTING"):
-        Base.metadata.create_all(bind=engine)
+        with engine.connect():
+            pass
     yield
     # Shutdown: cleanup if needed
 
@@ -28,16 +41,20 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# Configure CORS
+# Configure CORS. Methods and headers are listed explicitly (what the frontend
+# actually sends) so the middleware does not echo arbitrary preflight requests;
+# origins are a frozenset for constant-time membership checks.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.BACKEND_CORS_ORIGINS,
+    allow_origins=frozenset(settings.BACKEND_CORS_ORIGINS),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor", "ETag"],
 )
 
 
@@ -59,6 +76,8 @@ def root():
 
 
 @app.get("/health")
-def health_check():
+def health_check(response: Response):
     """Health check endpoint"""
+    # Probes must reach the app, never a proxy's cached copy
+    response.headers["Cache-Control"] = "no-store"
     return {"status": "healthy"}
@@ -1,11 +1,12 @@
 """
 Contract model for managing contracts
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Numeric, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, Sequence
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 import enum
 from ..core.database import Base
+from .mixins import TimestampMixin
+from .types import Cents
 
 
 class ContractStatus(str, enum.Enum):
@@ -22,20 +23,32 @@ class ContractStatus(str, enum.Enum):
     REJECTED = "rejected"
 
 
-class Contract(Base):
+# Source of auto-generated contract numbers on databases with sequences
+contract_number_seq = Sequence("contract_number_seq", metadata=Base.metadata)
+
+
+class Contract(TimestampMixin, Base):
     """Contract model for storing contract details"""
 
     __tablename__ = "contracts"
+    __table_args__ = (
+        # list_contracts filters by owner (non-admins) and optionally status
+        Index("ix_contracts_owner_status", "owner_id", "status"),
+        # status-only filters and recency ordering; also covers lookups by status alone
+        Index("ix_contracts_status_created", "status", "created_at"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String, nullable=False, index=True)
     description = Column(Text)
     content = Column(Text, nullable=False)  # Contract content/body
 
     # Contract details
     contract_number = Column(String, unique=True, index=True)
-    status = Column(SQLEnum(ContractStatus), nullable=False, default=ContractStatus.DRAFT, index=True)
-    contract_value = Column(Numeric(precision=15, scale=2))  # Monetary value
+    # Stored as the plain enum value; ContractResponse validates it back into
+    # ContractStatus, so the ORM does no per-row enum coercion
+    status = Column(String(32), nullable=False, default=ContractStatus.DRAFT.value)
+    contract_value = Column(Cents)  # Monetary value, stored as integer cents
     currency = Column(String(3), default="USD")  # ISO currency code
 
     # Dates
@@ -55,10 +68,6 @@ class Contract(Base):
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     template_id = Column(Integer, ForeignKey("templates.id"), nullable=True)
 
-    # Metadata
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-
     # Relationships
     owner = relationship("User", back_populates="contracts")
     template = relationship("Template", back_populates="contracts")
@@ -0,0 +1,21 @@
+"""
+Column mixins shared by the models
+"""
+from sqlalchemy import Column, DateTime
+from sqlalchemy.sql import func, null
+
+
+class TimestampMixin:
+    """
+    ``created_at``/``updated_at`` columns, fetched without follow-up SELECTs
+
+    ``eager_defaults`` returns server-generated values (``id``, ``created_at``,
+    and ``updated_at`` on update) through ``INSERT/UPDATE ... RETURNING``.
+    ``updated_at`` defaults to a literal NULL: left unset, the ORM would bind
+    ``None`` and re-select the column after the INSERT.
+    """
+
+    __mapper_args__ = {"eager_defaults": True}
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=null(), onupdate=func.now())
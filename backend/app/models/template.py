@@ -1,26 +1,32 @@
 """
 Template model for contract templates
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Boolean, Index, text
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 from ..core.database import Base
+from .mixins import TimestampMixin
 
 
-class Template(Base):
+class Template(TimestampMixin, Base):
     """Template model for storing contract templates"""
 
     __tablename__ = "templates"
+    __table_args__ = (
+        # list_templates' common case: active templates in a category, ordered by id
+        Index(
+            "ix_templates_active_category", "category", "id",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False, index=True)
     description = Column(Text)
     content = Column(Text, nullable=False)  # Template content/body
     category = Column(String, index=True)  # e.g., "NDA", "MSA", "SOW"
     is_active = Column(Boolean, default=True, nullable=False)
     created_by_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
     created_by = relationship("User", back_populates="templates")
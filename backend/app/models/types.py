@@ -0,0 +1,42 @@
+"""
+Custom column types shared by the models
+"""
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional
+
+from sqlalchemy import BigInteger
+from sqlalchemy.types import TypeDecorator
+
+_CENT = Decimal("0.01")
+
+# Largest amount whose cents fit a signed 64-bit BIGINT
+MAX_AMOUNT = Decimal(2 ** 63 - 1).scaleb(-2)
+
+
+def round_cents(value) -> Decimal:
+    """Round an amount half-up to whole cents, as ``NUMERIC(p, 2)`` does"""
+    return Decimal(value).quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+class Cents(TypeDecorator):
+    """
+    Monetary amount stored as a BIGINT number of cents
+
+    Python code keeps working with ``Decimal`` amounts with two decimal places;
+    the database driver only ever sees integers, which are cheaper to transfer
+    and decode than ``NUMERIC`` values. Amounts with more precision are rounded
+    half-up, matching ``NUMERIC(p, 2)``.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return int(round_cents(value).scaleb(2))
+
+    def process_result_value(self, value, dialect) -> Optional[Decimal]:
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-2)
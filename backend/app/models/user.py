@@ -1,11 +1,11 @@
 """
 User model for authentication and RBAC
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Boolean, Enum as SQLEnum
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 import enum
 from ..core.database import Base
+from .mixins import TimestampMixin
 
 
 class UserRole(str, enum.Enum):
@@ -16,23 +16,26 @@ class UserRole(str, enum.Enum):
     ADMIN = "admin"
 
 
-class User(Base):
+class User(TimestampMixin, Base):
     """User model for authentication and authorization"""
 
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     email = Column(String, unique=True, index=True, nullable=False)
     full_name = Column(String, nullable=False)
     hashed_password = Column(String, nullable=False)
     role = Column(SQLEnum(UserRole), nullable=False, default=UserRole.PROCUREMENT)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
     contracts = relationship("Contract", back_populates="owner", cascade="all, delete-orphan")
     templates = relationship("Template", back_populates="created_by", cascade="all, delete-orphan")
 
+    @property
+    def is_admin(self) -> bool:
+        """Whether the user has the admin role"""
+        return self.role == UserRole.ADMIN
+
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
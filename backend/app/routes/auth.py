@@ -3,22 +3,32 @@ Authentication routes
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from datetime import timedelta
 
-from ..core.database import get_db
+from ..core.database import get_db, is_unique_violation
 from ..core.security import (
     verify_password,
     get_password_hash,
     create_access_token
 )
-from ..core.config import settings
+from ..core.config import Settings, get_settings
 from ..models.user import User
 from ..schemas.user import UserCreate, UserResponse, Token
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 
+def _email_registered() -> HTTPException:
+    """Error for a registration with an email that is already in use"""
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Email already registered"
+    )
+
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """
@@ -34,15 +44,10 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     Raises:
         HTTPException: If email already exists
     """
-    # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
+    # Cheap existence check so a duplicate does not pay for a password hash
+    if db.scalar(select(User.id).where(User.email == user_data.email)) is not None:
+        raise _email_registered()
 
-    # Create new user
     hashed_password = get_password_hash(user_data.password)
     db_user = User(
         email=user_data.email,
@@ -52,8 +57,14 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     )
 
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    try:
+        db.commit()
+    except IntegrityError as exc:
+        # A concurrent registration can still win between the check and the insert
+        db.rollback()
+        if not is_unique_violation(exc, User.__table__.c.email):
+            raise
+        raise _email_registered()
 
     return db_user
 
@@ -61,7 +72,8 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
 @router.post("/login", response_model=Token)
 def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    settings: Settings = Depends(get_settings)
 ):
     """
     Login user and return access token
@@ -69,6 +81,7 @@ def login(
     Args:
         form_data: OAuth2 login form with username (email) and password
         db: Database session
+        settings: Application settings
 
     Returns:
         Access token
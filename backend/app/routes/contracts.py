@@ -1,27 +1,121 @@
 """
 Contract management routes
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status, Query
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, raiseload
+from typing import Iterator, List, Optional
+import hashlib
 import uuid
 
-from ..core.database import get_db
+from ..core.database import get_db, is_unique_violation
 from ..core.security import get_current_user
-from ..models.user import User, UserRole
-from ..models.contract import Contract, ContractStatus
+from ..models.user import User
+from ..models.contract import Contract, ContractStatus, contract_number_seq
 from ..schemas.contract import ContractCreate, ContractUpdate, ContractResponse
 
 router = APIRouter(prefix="/contracts", tags=["contracts"])
 
+# Rows fetched per round-trip when streaming an export
+EXPORT_BATCH_SIZE = 500
 
-def generate_contract_number() -> str:
-    """Generate unique contract number"""
+# Serializer for list_contracts pages, built once at import
+_contract_list_adapter = TypeAdapter(List[ContractResponse])
+
+
+# Attempts at inserting a contract with a generated number before giving up
+CONTRACT_NUMBER_ATTEMPTS = 3
+
+
+def generate_contract_number(db: Session) -> str:
+    """
+    Generate a contract number
+
+    Uses the ``contract_number_seq`` database sequence where available. Those
+    numbers are ``CT-S`` plus eight digits, a format the older random
+    ``CT-XXXXXXXX`` (hex) numbers cannot take; databases without sequences
+    (SQLite) keep the random suffix. Either can still clash with a number a
+    user chose, so callers must handle the unique violation.
+    """
+    if db.get_bind().dialect.supports_sequences:
+        return f"CT-S{db.scalar(select(contract_number_seq.next_value())):08d}"
     return f"CT-{uuid.uuid4().hex[:8].upper()}"
 
 
+def _contract_access_criteria(contract_id: int, current_user: User) -> list:
+    """WHERE criteria matching a contract the current user may access"""
+    criteria = [Contract.id == contract_id]
+    if not current_user.is_admin:
+        criteria.append(Contract.owner_id == current_user.id)
+    return criteria
+
+
+def _contract_not_found() -> HTTPException:
+    """
+    Error for a missing or inaccessible contract
+
+    Non-admins get the same 404 for other users' contracts, so they cannot
+    probe which contract IDs exist.
+    """
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Contract not found"
+    )
+
+
+def _get_accessible_contract(db: Session, contract_id: int, current_user: User) -> Contract:
+    """
+    Fetch a contract the current user is allowed to access
+
+    The ownership rule is part of the query, so one SELECT proves both that the
+    contract exists and that the user may see it.
+
+    Raises:
+        HTTPException: 404 if the contract does not exist or belongs to another user
+    """
+    stmt = select(Contract).where(*_contract_access_criteria(contract_id, current_user))
+    contract = db.execute(stmt).scalar_one_or_none()
+    if not contract:
+        raise _contract_not_found()
+    return contract
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header (one or more tags, or *) against etag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def _list_filters(
+    current_user: User,
+    status: Optional[ContractStatus],
+    owner_id: Optional[int],
+) -> list:
+    """WHERE criteria for the contract list/export visible to current_user"""
+    filters = []
+
+    # Non-admin users can only see their own contracts
+    if not current_user.is_admin:
+        filters.append(Contract.owner_id == current_user.id)
+    elif owner_id:
+        # Admin can filter by owner_id
+        filters.append(Contract.owner_id == owner_id)
+
+    # Apply status filter
+    if status:
+        filters.append(Contract.status == status)
+
+    return filters
+
+
 @router.post("/", response_model=ContractResponse, status_code=status.HTTP_201_CREATED)
-async def create_contract(
+def create_contract(
     contract_data: ContractCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -37,24 +131,45 @@ async def create_contract(
     Returns:
         Created contract data
     """
-    # Generate contract number if not provided
-    contract_number = contract_data.contract_number or generate_contract_number()
-
-    db_contract = Contract(
-        **contract_data.model_dump(exclude={"contract_number"}),
-        contract_number=contract_number,
-        owner_id=current_user.id
+    values = contract_data.model_dump(exclude={"contract_number"})
+
+    # A generated number that is already taken is replaced by a fresh one; a
+    # number the user chose is reported back instead
+    for _ in range(CONTRACT_NUMBER_ATTEMPTS):
+        # INSERT ... RETURNING the whole row, so the response carries the
+        # stored values (rounded amounts, database-normalised timestamps)
+        stmt = (
+            insert(Contract)
+            .values(
+                **values,
+                contract_number=contract_data.contract_number or generate_contract_number(db),
+                owner_id=current_user.id
+            )
+            .returning(Contract)
+        )
+        try:
+            db_contract = db.scalars(stmt).one()
+            db.commit()
+        except IntegrityError as exc:
+            db.rollback()
+            if not is_unique_violation(exc, Contract.__table__.c.contract_number):
+                raise
+            if contract_data.contract_number:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Contract number already exists"
+                )
+            continue
+        return db_contract
+
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Could not allocate a contract number, please retry"
     )
 
-    db.add(db_contract)
-    db.commit()
-    db.refresh(db_contract)
-
-    return db_contract
-
 
 @router.get("/", response_model=List[ContractResponse])
-async def list_contracts(
+def list_contracts(
     skip: int = 0,
     limit: int = 100,
     status: Optional[ContractStatus] = Query(None, description="Filter by status"),
@@ -74,32 +189,101 @@ async def list_contracts(
         db: Database session
 
     Returns:
-        List of contracts
+        JSON list of contracts
 
     Notes:
         - Non-admin users can only see their own contracts
         - Admins can see all contracts
+        - The total number of matching contracts is returned in the
+          X-Total-Count header
     """
-    query = db.query(Contract)
+    filters = _list_filters(current_user, status, owner_id)
+
+    # count(*) OVER () returns the total alongside the page in one round-trip.
+    # ContractResponse only exposes owner_id/template_id, so relationship
+    # loads would be wasted N+1 queries; raiseload turns them into errors.
+    stmt = (
+        select(Contract, func.count().over().label("total"))
+        .options(raiseload("*"))
+        .where(*filters)
+        .order_by(Contract.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    rows = db.execute(stmt).all()
+
+    if rows:
+        total = rows[0].total
+    elif skip:
+        # Page is past the end; the window function had no rows to report on
+        total = db.scalar(select(func.count()).select_from(Contract).where(*filters))
+    else:
+        total = 0
+
+    # Returning a Response bypasses FastAPI's response_model handling (which stays
+    # for the OpenAPI schema); the adapter validates and encodes in one pass
+    contracts = _contract_list_adapter.validate_python(
+        [row.Contract for row in rows], from_attributes=True
+    )
+    return Response(
+        content=_contract_list_adapter.dump_json(contracts),
+        media_type="application/json",
+        headers={"X-Total-Count": str(total)},
+    )
 
-    # Non-admin users can only see their own contracts
-    if current_user.role != UserRole.ADMIN:
-        query = query.filter(Contract.owner_id == current_user.id)
-    elif owner_id:
-        # Admin can filter by owner_id
-        query = query.filter(Contract.owner_id == owner_id)
 
-    # Apply status filter
-    if status:
-        query = query.filter(Contract.status == status)
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+def export_contracts(
+    status: Optional[ContractStatus] = Query(None, description="Filter by status"),
+    owner_id: Optional[int] = Query(None, description="Filter by owner ID"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Stream all matching contracts as newline-delimited JSON
+
+    Args:
+        status: Optional status filter
+        owner_id: Optional owner ID filter
+        current_user: Current authenticated user
+        db: Database session
 
-    contracts = query.offset(skip).limit(limit).all()
-    return contracts
+    Returns:
+        One ContractResponse object per line
+
+    Notes:
+        - Same visibility rules and filters as the contract list, without paging
+        - Rows are fetched in batches, so memory use does not grow with the result
+    """
+    stmt = (
+        select(Contract)
+        .options(raiseload("*"))
+        .where(*_list_filters(current_user, status, owner_id))
+        .order_by(Contract.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+
+    def generate() -> Iterator[str]:
+        # get_db has already closed the session by the time the body is
+        # streamed; using it again checks out a fresh connection, which is
+        # released here once the export finishes or the client disconnects.
+        try:
+            for contract in db.scalars(stmt):
+                yield ContractResponse.model_validate(contract).model_dump_json() + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/{contract_id}", response_model=ContractResponse)
-async def get_contract(
+def get_contract(
     contract_id: int,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -108,34 +292,32 @@ async def get_contract(
 
     Args:
         contract_id: Contract ID
+        if_none_match: ETag from a previous response, for conditional requests
         current_user: Current authenticated user
         db: Database session
 
     Returns:
-        Contract data
+        Contract data with an ETag header, or 304 Not Modified if the
+        contract still matches If-None-Match
 
     Raises:
-        HTTPException: If contract not found or unauthorized
+        HTTPException: If contract not found or not accessible to the user
     """
-    contract = db.query(Contract).filter(Contract.id == contract_id).first()
-    if not contract:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Contract not found"
-        )
+    contract = _get_accessible_contract(db, contract_id, current_user)
 
-    # Check authorization: user must own the contract or be admin
-    if contract.owner_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view this contract"
-        )
+    # Tag the serialized body itself: updated_at alone has only second
+    # resolution on some backends and is NULL until the first update
+    body = ContractResponse.model_validate(contract).model_dump_json().encode()
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
 
-    return contract
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.put("/{contract_id}", response_model=ContractResponse)
-async def update_contract(
+def update_contract(
     contract_id: int,
     contract_data: ContractUpdate,
     current_user: User = Depends(get_current_user),
@@ -154,35 +336,32 @@ async def update_contract(
         Updated contract data
 
     Raises:
-        HTTPException: If contract not found or unauthorized
+        HTTPException: If contract not found or not accessible to the user
     """
-    contract = db.query(Contract).filter(Contract.id == contract_id).first()
+    # Only the fields the client sent, without dumping the whole model
+    update_data = {field: getattr(contract_data, field) for field in contract_data.model_fields_set}
+    if not update_data:
+        return _get_accessible_contract(db, contract_id, current_user)
+
+    # Single UPDATE ... RETURNING: the access criteria double as the existence
+    # and authorization check, and the row comes back without a reload
+    stmt = (
+        update(Contract)
+        .where(*_contract_access_criteria(contract_id, current_user))
+        .values(**update_data)
+        .returning(Contract)
+    )
+    contract = db.scalars(stmt).one_or_none()
     if not contract:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Contract not found"
-        )
-
-    # Check authorization
-    if contract.owner_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this contract"
-        )
-
-    # Update contract fields
-    update_data = contract_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(contract, field, value)
+        raise _contract_not_found()
 
     db.commit()
-    db.refresh(contract)
 
     return contract
 
 
 @router.delete("/{contract_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_contract(
+def delete_contract(
     contract_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -196,23 +375,11 @@ async def delete_contract(
         db: Database session
 
     Raises:
-        HTTPException: If contract not found or unauthorized
+        HTTPException: If contract not found or not accessible to the user
     """
-    contract = db.query(Contract).filter(Contract.id == contract_id).first()
-    if not contract:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Contract not found"
-        )
-
-    # Check authorization
-    if contract.owner_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this contract"
-        )
+    contract = _get_accessible_contract(db, contract_id, current_user)
 
     db.delete(contract)
     db.commit()
 
-    return None
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,23 +1,35 @@
 """
 Template management routes
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from pydantic import TypeAdapter
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session, raiseload
 from typing import List, Optional
 
+from ..core.cache import template_cache
 from ..core.database import get_db
-from ..core.security import get_current_user, check_user_role
+from ..core.pagination import next_cursor_headers
+from ..core.security import get_current_user, require_legal_or_admin
 from ..models.user import User
 from ..models.template import Template
+from ..models.contract import Contract
 from ..schemas.template import TemplateCreate, TemplateUpdate, TemplateResponse
 
 router = APIRouter(prefix="/templates", tags=["templates"])
 
+_template_list_adapter = TypeAdapter(List[TemplateResponse])
+
+
+def _json_response(body: bytes, headers: Optional[dict] = None) -> Response:
+    """Wrap an already-serialized JSON body"""
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @router.post("/", response_model=TemplateResponse, status_code=status.HTTP_201_CREATED)
-async def create_template(
+def create_template(
     template_data: TemplateCreate,
-    current_user: User = Depends(check_user_role(["legal", "admin"])),
+    current_user: User = Depends(require_legal_or_admin),
     db: Session = Depends(get_db)
 ):
     """
@@ -38,15 +50,16 @@ async def create_template(
 
     db.add(db_template)
     db.commit()
-    db.refresh(db_template)
+    template_cache.clear()
 
     return db_template
 
 
 @router.get("/", response_model=List[TemplateResponse])
-async def list_templates(
+def list_templates(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[int] = Query(None, description="Return templates after this ID (from X-Next-Cursor)"),
     category: Optional[str] = Query(None, description="Filter by category"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     current_user: User = Depends(get_current_user),
@@ -58,28 +71,47 @@ async def list_templates(
     Args:
         skip: Number of records to skip
         limit: Maximum number of records to return
+        cursor: Only return templates with a greater ID
         category: Optional category filter
         is_active: Optional active status filter
         current_user: Current authenticated user
         db: Database session
 
     Returns:
-        List of templates
+        List of templates ordered by ID
+
+    Notes:
+        - When the page is full, X-Next-Cursor holds the cursor for the next
+          page; seeking by ID stays fast however deep the client pages
+        - Responses are cached per worker for TEMPLATE_CACHE_TTL_SECONDS
     """
-    query = db.query(Template)
+    cache_key = ("list", skip, limit, cursor, category, is_active)
+    cached = template_cache.get(cache_key)
+    if cached is not None:
+        return _json_response(*cached)
+
+    # TemplateResponse exposes no relationships; fail loudly instead of N+1
+    stmt = select(Template).options(raiseload("*")).order_by(Template.id)
 
     # Apply filters
+    if cursor is not None:
+        stmt = stmt.where(Template.id > cursor)
     if category:
-        query = query.filter(Template.category == category)
+        stmt = stmt.where(Template.category == category)
     if is_active is not None:
-        query = query.filter(Template.is_active == is_active)
+        stmt = stmt.where(Template.is_active == is_active)
 
-    templates = query.offset(skip).limit(limit).all()
-    return templates
+    templates = db.scalars(stmt.offset(skip).limit(limit)).all()
+    body = _template_list_adapter.dump_json(
+        _template_list_adapter.validate_python(templates, from_attributes=True)
+    )
+    headers = next_cursor_headers(templates, limit)
+    template_cache.set(cache_key, (body, headers))
+    return _json_response(body, headers)
 
 
 @router.get("/{template_id}", response_model=TemplateResponse)
-async def get_template(
+def get_template(
     template_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -98,21 +130,28 @@ async def get_template(
     Raises:
         HTTPException: If template not found
     """
-    template = db.query(Template).filter(Template.id == template_id).first()
+    cache_key = ("get", template_id)
+    body = template_cache.get(cache_key)
+    if body is not None:
+        return _json_response(body)
+
+    template = db.get(Template, template_id)
     if not template:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Template not found"
         )
 
-    return template
+    body = TemplateResponse.model_validate(template).model_dump_json().encode()
+    template_cache.set(cache_key, body)
+    return _json_response(body)
 
 
 @router.put("/{template_id}", response_model=TemplateResponse)
-async def update_template(
+def update_template(
     template_id: int,
     template_data: TemplateUpdate,
-    current_user: User = Depends(check_user_role(["legal", "admin"])),
+    current_user: User = Depends(require_legal_or_admin),
     db: Session = Depends(get_db)
 ):
     """
@@ -130,28 +169,36 @@ async def update_template(
     Raises:
         HTTPException: If template not found
     """
-    template = db.query(Template).filter(Template.id == template_id).first()
+    # Sent fields only, as in update_contract
+    update_data = {field: getattr(template_data, field) for field in template_data.model_fields_set}
+    if update_data:
+        # Single UPDATE ... RETURNING instead of SELECT, UPDATE and reload
+        stmt = (
+            update(Template)
+            .where(Template.id == template_id)
+            .values(**update_data)
+            .returning(Template)
+        )
+        template = db.scalars(stmt).one_or_none()
+    else:
+        template = db.get(Template, template_id)
+
     if not template:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Template not found"
         )
 
-    # Update template fields
-    update_data = template_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(template, field, value)
-
     db.commit()
-    db.refresh(template)
+    template_cache.clear()
 
     return template
 
 
 @router.delete("/{template_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_template(
+def delete_template(
     template_id: int,
-    current_user: User = Depends(check_user_role(["legal", "admin"])),
+    current_user: User = Depends(require_legal_or_admin),
     db: Session = Depends(get_db)
 ):
     """
@@ -165,14 +212,23 @@ async def delete_template(
     Raises:
         HTTPException: If template not found
     """
-    template = db.query(Template).filter(Template.id == template_id).first()
-    if not template:
+    # Contracts keep existing without their template (what the ORM delete did
+    # after loading them); then delete by ID, using RETURNING as the 404 check
+    db.execute(
+        update(Contract)
+        .where(Contract.template_id == template_id)
+        .values(template_id=None)
+    )
+    deleted_id = db.scalar(
+        delete(Template).where(Template.id == template_id).returning(Template.id)
+    )
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Template not found"
         )
 
-    db.delete(template)
     db.commit()
+    template_cache.clear()
 
-    return None
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
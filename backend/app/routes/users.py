@@ -1,18 +1,25 @@
 """
 User management routes
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from pydantic import TypeAdapter
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, raiseload
+from typing import List, Optional
 
+from ..core.cache import template_cache
 from ..core.database import get_db
-from ..core.security import get_current_user, check_user_role, get_password_hash
-from ..models.user import User, UserRole
+from ..core.pagination import next_cursor_headers
+from ..core.security import get_current_user, get_password_hash, require_admin, user_cache
+from ..models.user import User
 from ..schemas.user import UserResponse, UserUpdate
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+_user_list_adapter = TypeAdapter(List[UserResponse])
 
+
+# Stays async: it does no blocking I/O (the user comes from the dependency)
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_profile(current_user: User = Depends(get_current_user)):
     """
@@ -28,10 +35,11 @@ async def get_current_user_profile(current_user: User = Depends(get_current_user
 
 
 @router.get("/", response_model=List[UserResponse])
-async def list_users(
+def list_users(
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(check_user_role(["admin"])),
+    cursor: Optional[int] = Query(None, description="Return users after this ID (from X-Next-Cursor)"),
+    current_user: User = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """
@@ -40,18 +48,33 @@ async def list_users(
     Args:
         skip: Number of records to skip
         limit: Maximum number of records to return
+        cursor: Only return users with a greater ID
         current_user: Current authenticated admin user
         db: Database session
 
     Returns:
-        List of users
+        List of users ordered by ID
     """
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+    # No relationships are serialized (see list_templates)
+    stmt = select(User).options(raiseload("*")).order_by(User.id)
+    if cursor is not None:
+        stmt = stmt.where(User.id > cursor)
+
+    users = db.scalars(stmt.offset(skip).limit(limit)).all()
+
+    # One-pass page encoding, as in list_contracts
+    body = _user_list_adapter.dump_json(
+        _user_list_adapter.validate_python(users, from_attributes=True)
+    )
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=next_cursor_headers(users, limit),
+    )
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(
+def get_user(
     user_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -71,13 +94,13 @@ async def get_user(
         HTTPException: If user not found or unauthorized
     """
     # Users can only view their own profile unless they're admin
-    if current_user.id != user_id and current_user.role != UserRole.ADMIN:
+    if current_user.id != user_id and not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to view this user"
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -88,7 +111,7 @@ async def get_user(
 
 
 @router.put("/{user_id}", response_model=UserResponse)
-async def update_user(
+def update_user(
     user_id: int,
     user_data: UserUpdate,
     current_user: User = Depends(get_current_user),
@@ -110,44 +133,51 @@ async def update_user(
         HTTPException: If user not found or unauthorized
     """
     # Users can only update their own profile unless they're admin
-    if current_user.id != user_id and current_user.role != UserRole.ADMIN:
+    if current_user.id != user_id and not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update this user"
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-
-    # Update user fields
-    update_data = user_data.model_dump(exclude_unset=True)
+    # Sent fields only, as in update_contract
+    update_data = {field: getattr(user_data, field) for field in user_data.model_fields_set}
 
     # Hash password if provided
     if "password" in update_data:
         update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
 
     # Only admin can change role and is_active
-    if current_user.role != UserRole.ADMIN:
+    if not current_user.is_admin:
         update_data.pop("role", None)
         update_data.pop("is_active", None)
 
-    for field, value in update_data.items():
-        setattr(user, field, value)
+    if update_data:
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(**update_data)
+            .returning(User)
+        )
+        user = db.scalars(stmt).one_or_none()
+    else:
+        user = db.get(User, user_id)
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
 
     db.commit()
-    db.refresh(user)
+    user_cache.pop(user_id)
 
     return user
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user(
+def delete_user(
     user_id: int,
-    current_user: User = Depends(check_user_role(["admin"])),
+    current_user: User = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """
@@ -161,7 +191,9 @@ async def delete_user(
     Raises:
         HTTPException: If user not found
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    # Loaded through the ORM (not DELETE ... RETURNING) so the cascade on
+    # User.contracts/User.templates removes the user's rows as well
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -170,5 +202,8 @@ async def delete_user(
 
     db.delete(user)
     db.commit()
+    user_cache.pop(user_id)
+    # The cascade removed the user's templates too
+    template_cache.clear()
 
-    return None
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
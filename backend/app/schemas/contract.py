@@ -1,11 +1,22 @@
 """
 Pydantic schemas for Contract model
 """
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 from datetime import datetime
 from typing import Optional
 from decimal import Decimal
 from ..models.contract import ContractStatus
+from ..models.types import MAX_AMOUNT, round_cents
+
+
+def _check_contract_value(v: Optional[Decimal]) -> Optional[Decimal]:
+    """Round to cents and reject amounts the cents column cannot hold"""
+    if v is None:
+        return v
+    # Range check first: quantizing a huge amount overflows the decimal context
+    if abs(v) > MAX_AMOUNT:
+        raise ValueError('Contract value is too large')
+    return round_cents(v)
 
 
 class ContractBase(BaseModel):
@@ -21,6 +32,12 @@ class ContractBase(BaseModel):
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
 
+    @field_validator('contract_value')
+    @classmethod
+    def validate_contract_value(cls, v: Optional[Decimal]) -> Optional[Decimal]:
+        """Round to cents so the response matches the stored amount"""
+        return _check_contract_value(v)
+
 
 class ContractCreate(ContractBase):
     """Schema for creating a new contract"""
@@ -41,6 +58,12 @@ class ContractUpdate(BaseModel):
     end_date: Optional[datetime] = None
     signature_date: Optional[datetime] = None
 
+    @field_validator('contract_value')
+    @classmethod
+    def validate_contract_value(cls, v: Optional[Decimal]) -> Optional[Decimal]:
+        """Round to cents so the response matches the stored amount"""
+        return _check_contract_value(v)
+
 
 class ContractResponse(ContractBase):
     """Schema for contract response"""
@@ -4,8 +4,29 @@ Pydantic schemas for User model
 from pydantic import BaseModel, EmailStr, ConfigDict, field_validator
 from datetime import datetime
 from typing import Optional
+import re
 from ..models.user import UserRole
 
+# 8-72 characters (bcrypt limit) with at least one ASCII digit and letter
+_PASSWORD_RE = re.compile(r"(?=.*[0-9])(?=.*[A-Za-z]).{8,72}", re.DOTALL)
+
+
+def _check_password(v: str) -> str:
+    """Validate password meets security requirements"""
+    # One regex pass accepts typical passwords; the checks below explain
+    # rejections and apply the full Unicode digit/letter rules
+    if _PASSWORD_RE.fullmatch(v):
+        return v
+    if len(v) < 8:
+        raise ValueError('Password must be at least 8 characters long')
+    if len(v) > 72:
+        raise ValueError('Password cannot exceed 72 characters (bcrypt limitation)')
+    if not any(c.isdigit() for c in v):
+        raise ValueError('Password must contain at least one digit')
+    if not any(c.isalpha() for c in v):
+        raise ValueError('Password must contain at least one letter')
+    return v
+
 
 class UserBase(BaseModel):
     """Base user schema with common fields"""
@@ -28,15 +49,7 @@ class UserCreate(UserBase):
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password meets security requirements"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if len(v) > 72:
-            raise ValueError('Password cannot exceed 72 characters (bcrypt limitation)')
-        if not any(c.isdigit() for c in v):
-            raise ValueError('Password must contain at least one digit')
-        if not any(c.isalpha() for c in v):
-            raise ValueError('Password must contain at least one letter')
-        return v
+        return _check_password(v)
 
 
 class UserUpdate(BaseModel):
@@ -53,15 +66,7 @@ class UserUpdate(BaseModel):
         """Validate password meets security requirements"""
         if v is None:
             return v
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if len(v) > 72:
-            raise ValueError('Password cannot exceed 72 characters (bcrypt limitation)')
-        if not any(c.isdigit() for c in v):
-            raise ValueError('Password must contain at least one digit')
-        if not any(c.isalpha() for c in v):
-            raise ValueError('Password must contain at least one letter')
-        return v
+        return _check_password(v)
 
 
 class UserResponse(UserBase):
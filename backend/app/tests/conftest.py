@@ -1,18 +1,29 @@
 """
 Pytest configuration and fixtures
 """
+import functools
+import os
+
+# Minimum bcrypt cost for the suite; must be set before the settings load
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, func, insert, select
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from ..main import app
+from ..core.cache import template_cache
 from ..core.database import Base, get_db
-from ..core.security import get_password_hash
+from ..core.security import create_access_token, get_password_hash, user_cache
+from ..models.contract import Contract
 from ..models.user import User, UserRole
 
-# Use SQLite in-memory database for testing
+# Use SQLite in-memory database for testing. Every pytest-xdist worker is a
+# separate process with its own database, so no shared-cache URI is needed,
+# and WAL does not apply to in-memory databases. StaticPool keeps the single
+# connection the per-test transaction below relies on.
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 
 engine = create_engine(
@@ -20,7 +31,33 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    """Let SQLAlchemy emit BEGIN itself so SAVEPOINTs nest correctly"""
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+# Sessions join the per-test transaction below; their commits only release a savepoint
+TestingSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+    join_transaction_mode="create_savepoint",
+)
+
+
+@functools.cache
+def _hash(password: str) -> str:
+    """Hash a fixture password once per run instead of once per test"""
+    return get_password_hash(password)
 
 
 def override_get_db():
@@ -32,29 +69,61 @@ def override_get_db():
         db.close()
 
 
-@pytest.fixture
-def db_session():
-    """Create a fresh database for each test"""
+@pytest.fixture(scope="session")
+def db_schema():
+    """Create the database schema once for the whole run"""
     Base.metadata.create_all(bind=engine)
-    yield TestingSessionLocal()
+    yield
+    # Tests are isolated by rollback rather than DELETE/TRUNCATE; check once that nothing leaked
+    with engine.connect() as conn:
+        leaked = [
+            table.name
+            for table in Base.metadata.sorted_tables
+            if conn.scalar(select(func.count()).select_from(table))
+        ]
+    assert not leaked, f"Rows left behind in {leaked}"
     Base.metadata.drop_all(bind=engine)
 
 
 @pytest.fixture
-def client(db_session):
-    """Create test client with overridden database"""
+def db_session(db_schema):
+    """Run each test in a transaction that is rolled back afterwards"""
+    connection = engine.connect()
+    transaction = connection.begin()
+    TestingSessionLocal.configure(bind=connection)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+    TestingSessionLocal.configure(bind=engine)
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    """Start the application once for the whole run"""
     # Set testing flag to skip lifespan database creation
-    import os
     os.environ["TESTING"] = "1"
 
+    with TestClient(app, raise_server_exceptions=True) as test_client:
+        yield test_client
+
+    del os.environ["TESTING"]
+
+
+@pytest.fixture
+def client(app_client, db_session):
+    """Create test client with overridden database"""
     # Override database dependency
     app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app, raise_server_exceptions=True) as test_client:
-        yield test_client
+    yield app_client
 
     app.dependency_overrides.clear()
-    del os.environ["TESTING"]
+    app_client.cookies.clear()
+    # IDs are reused across tests, so drop anything cached by this one
+    user_cache.clear()
+    template_cache.clear()
 
 
 @pytest.fixture
@@ -64,7 +133,7 @@ def test_user(db_session):
         email="test@example.com",
         full_name="Test User",
         role=UserRole.PROCUREMENT,
-        hashed_password=get_password_hash("testpass123"),
+        hashed_password=_hash("testpass123"),
         is_active=True
     )
     db_session.add(user)
@@ -80,7 +149,7 @@ def test_legal_user(db_session):
         email="legal@example.com",
         full_name="Legal User",
         role=UserRole.LEGAL,
-        hashed_password=get_password_hash("legalpass123"),
+        hashed_password=_hash("legalpass123"),
         is_active=True
     )
     db_session.add(user)
@@ -96,7 +165,7 @@ def test_admin_user(db_session):
         email="admin@example.com",
         full_name="Admin User",
         role=UserRole.ADMIN,
-        hashed_password=get_password_hash("adminpass123"),
+        hashed_password=_hash("adminpass123"),
         is_active=True
     )
     db_session.add(user)
@@ -106,33 +175,59 @@ def test_admin_user(db_session):
 
 
 @pytest.fixture
-def auth_headers(client, test_user):
+def make_contracts(db_session):
+    """
+    Factory that bulk-inserts contracts for list and pagination tests
+
+    All rows go in with one executemany INSERT and one commit; extra keyword
+    arguments override the column values of every row. Returns the new ids.
+    """
+    def _make_contracts(owner_id: int, n: int, **values) -> list[int]:
+        rows = [
+            {
+                "title": f"Bulk Contract {i}",
+                "content": "This is a test contract...",
+                "contract_number": f"CT-BULK{i:04d}",
+                "counterparty_name": "ACME Corp",
+                "owner_id": owner_id,
+                **values,
+            }
+            for i in range(n)
+        ]
+        ids = db_session.scalars(
+            insert(Contract).returning(Contract.id, sort_by_parameter_order=True), rows
+        ).all()
+        db_session.commit()
+        return list(ids)
+
+    return _make_contracts
+
+
+@functools.cache
+def _token(user_id: int, role: str) -> str:
+    """Mint the token /auth/login would issue, without the request or bcrypt check"""
+    # Keyed by id: ids are reassigned after each rollback, and the token carries the id
+    return create_access_token(data={"sub": str(user_id), "role": role})
+
+
+def _auth_headers(user) -> dict:
+    """Authorization headers for a fixture user"""
+    return {"Authorization": f"Bearer {_token(user.id, user.role.value)}"}
+
+
+@pytest.fixture
+def auth_headers(test_user):
     """Get authentication headers for test user"""
-    response = client.post(
-        "/api/v1/auth/login",
-        data={"username": "test@example.com", "password": "testpass123"}
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+    return _auth_headers(test_user)
 
 
 @pytest.fixture
-def legal_auth_headers(client, test_legal_user):
+def legal_auth_headers(test_legal_user):
     """Get authentication headers for legal user"""
-    response = client.post(
-        "/api/v1/auth/login",
-        data={"username": "legal@example.com", "password": "legalpass123"}
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+    return _auth_headers(test_legal_user)
 
 
 @pytest.fixture
-def admin_auth_headers(client, test_admin_user):
+def admin_auth_headers(test_admin_user):
     """Get authentication headers for admin user"""
-    response = client.post(
-        "/api/v1/auth/login",
-        data={"username": "admin@example.com", "password": "adminpass123"}
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+    return _auth_headers(test_admin_user)
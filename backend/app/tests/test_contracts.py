@@ -1,6 +1,7 @@
 """
 Tests for contract management endpoints
 """
+import json
 import pytest
 from fastapi import status
 from datetime import datetime, timedelta
@@ -48,6 +49,54 @@ def test_create_contract(client, auth_headers):
     assert data["status"] == "draft"
 
 
+def test_contract_value_round_trip(client, auth_headers, test_contract):
+    """Test that contract values keep two decimal places through storage"""
+    response = client.put(
+        f"/api/v1/contracts/{test_contract.id}",
+        headers=auth_headers,
+        json={"contract_value": "1234.5"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["contract_value"] == "1234.50"
+
+    response = client.get(f"/api/v1/contracts/{test_contract.id}", headers=auth_headers)
+    assert response.json()["contract_value"] == "1234.50"
+
+
+
+def test_create_contract_rounds_value(client, auth_headers):
+    """Test that a created contract reports the amount rounded to cents"""
+    response = client.post(
+        "/api/v1/contracts/",
+        headers=auth_headers,
+        json={
+            "title": "Rounded Contract",
+            "content": "Contract content...",
+            "counterparty_name": "Partner Co",
+            "contract_value": "12.345"
+        }
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["contract_value"] == "12.35"
+
+    response = client.get(f"/api/v1/contracts/{response.json()['id']}", headers=auth_headers)
+    assert response.json()["contract_value"] == "12.35"
+
+
+def test_create_contract_value_out_of_range(client, auth_headers):
+    """Test that amounts too large for the cents column are rejected"""
+    response = client.post(
+        "/api/v1/contracts/",
+        headers=auth_headers,
+        json={
+            "title": "Huge Contract",
+            "content": "Contract content...",
+            "counterparty_name": "Partner Co",
+            "contract_value": "1e30"
+        }
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
 def test_create_contract_with_dates(client, auth_headers):
     """Test creating contract with start and end dates"""
     start_date = datetime.utcnow()
@@ -70,6 +119,25 @@ def test_create_contract_with_dates(client, auth_headers):
     assert data["end_date"] is not None
 
 
+
+def test_create_contract_returns_stored_row(client, auth_headers):
+    """Test that the create response matches what a later GET returns"""
+    response = client.post(
+        "/api/v1/contracts/",
+        headers=auth_headers,
+        json={
+            "title": "Offset Contract",
+            "content": "Contract content...",
+            "counterparty_name": "Partner Co",
+            "start_date": "2024-01-01T10:00:00+02:00"
+        }
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    created = response.json()
+
+    response = client.get(f"/api/v1/contracts/{created['id']}", headers=auth_headers)
+    assert response.json() == created
+
 def test_list_contracts(client, auth_headers, test_contract):
     """Test listing contracts"""
     response = client.get("/api/v1/contracts/", headers=auth_headers)
@@ -79,6 +147,47 @@ def test_list_contracts(client, auth_headers, test_contract):
     assert len(data) > 0
 
 
+def test_list_contracts_total_count(client, auth_headers, test_contract):
+    """Test that the total number of matching contracts is returned in a header"""
+    response = client.get("/api/v1/contracts/?limit=1", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Total-Count"] == "1"
+
+    # Past the last page the total is still reported
+    response = client.get("/api/v1/contracts/?skip=5", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+    assert response.headers["X-Total-Count"] == "1"
+
+
+def test_list_contracts_pagination(client, auth_headers, test_user, make_contracts):
+    """Test paging through contracts with skip and limit"""
+    ids = make_contracts(test_user.id, 5)
+
+    pages = []
+    for skip in range(0, 6, 2):
+        response = client.get(f"/api/v1/contracts/?skip={skip}&limit=2", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["X-Total-Count"] == "5"
+        pages.append([c["id"] for c in response.json()])
+
+    assert pages == [ids[0:2], ids[2:4], ids[4:]]
+
+
+def test_export_contracts(client, auth_headers, legal_auth_headers, test_contract):
+    """Test streaming contracts as newline-delimited JSON"""
+    response = client.get("/api/v1/contracts/export", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [c["id"] for c in lines] == [test_contract.id]
+
+    # Other users' contracts are not exported
+    response = client.get("/api/v1/contracts/export", headers=legal_auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.text == ""
+
+
 def test_list_contracts_with_status_filter(client, auth_headers, test_contract):
     """Test listing contracts with status filter"""
     response = client.get("/api/v1/contracts/?status=draft", headers=auth_headers)
@@ -114,10 +223,28 @@ def test_get_contract_by_id(client, auth_headers, test_contract):
     assert data["title"] == test_contract.title
 
 
+def test_get_contract_conditional(client, auth_headers, test_contract):
+    """Test ETag and If-None-Match handling when getting a contract"""
+    url = f"/api/v1/contracts/{test_contract.id}"
+    response = client.get(url, headers=auth_headers)
+    etag = response.headers["ETag"]
+
+    response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+    # A changed contract no longer matches the old tag
+    client.put(url, headers=auth_headers, json={"title": "Retitled"})
+    response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["title"] == "Retitled"
+    assert response.headers["ETag"] != etag
+
+
 def test_get_other_users_contract(client, legal_auth_headers, test_contract):
     """Test that user cannot get another user's contract"""
     response = client.get(f"/api/v1/contracts/{test_contract.id}", headers=legal_auth_headers)
-    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
 def test_admin_can_get_any_contract(client, admin_auth_headers, test_contract):
@@ -142,6 +269,17 @@ def test_update_contract(client, auth_headers, test_contract):
     assert data["status"] == "pending_review"
 
 
+def test_update_contract_without_changes(client, auth_headers, test_contract):
+    """Test that an empty update returns the contract unchanged"""
+    response = client.put(
+        f"/api/v1/contracts/{test_contract.id}",
+        headers=auth_headers,
+        json={}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["title"] == test_contract.title
+
+
 def test_update_other_users_contract(client, legal_auth_headers, test_contract):
     """Test that user cannot update another user's contract"""
     response = client.put(
@@ -149,23 +287,28 @@ def test_update_other_users_contract(client, legal_auth_headers, test_contract):
         headers=legal_auth_headers,
         json={"title": "Hacked Title"}
     )
-    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
 def test_delete_contract(client, auth_headers, test_contract):
     """Test deleting a contract"""
     response = client.delete(f"/api/v1/contracts/{test_contract.id}", headers=auth_headers)
     assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert response.content == b""
 
     # Verify it's deleted
     response = client.get(f"/api/v1/contracts/{test_contract.id}", headers=auth_headers)
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_delete_other_users_contract(client, legal_auth_headers, test_contract):
+def test_delete_other_users_contract(client, auth_headers, legal_auth_headers, test_contract):
     """Test that user cannot delete another user's contract"""
     response = client.delete(f"/api/v1/contracts/{test_contract.id}", headers=legal_auth_headers)
-    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    # The owner still sees the contract
+    response = client.get(f"/api/v1/contracts/{test_contract.id}", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
 
 
 def test_get_nonexistent_contract(client, auth_headers):
@@ -189,3 +332,38 @@ def test_contract_number_generation(client, auth_headers):
     data = response.json()
     assert data["contract_number"] is not None
     assert data["contract_number"].startswith("CT-")
+
+
+def test_create_contract_duplicate_number(client, auth_headers, test_contract):
+    """Test that a user-supplied contract number already in use is rejected"""
+    response = client.post(
+        "/api/v1/contracts/",
+        headers=auth_headers,
+        json={
+            "title": "Duplicate Number Contract",
+            "content": "Content...",
+            "counterparty_name": "Partner",
+            "contract_number": test_contract.contract_number
+        }
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Contract number already exists"
+
+
+def test_contract_number_generation_retries(client, auth_headers, test_contract, monkeypatch):
+    """Test that a generated contract number already in use is replaced"""
+    from ..routes import contracts
+
+    numbers = iter([test_contract.contract_number, "CT-RETRY001"])
+    monkeypatch.setattr(contracts, "generate_contract_number", lambda db: next(numbers))
+    response = client.post(
+        "/api/v1/contracts/",
+        headers=auth_headers,
+        json={
+            "title": "Retried Number Contract",
+            "content": "Content...",
+            "counterparty_name": "Partner"
+        }
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["contract_number"] == "CT-RETRY001"
@@ -0,0 +1,58 @@
+"""
+Tests for application wiring
+"""
+from collections import Counter
+
+from fastapi import status
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.routing import APIRoute
+
+from ..main import app
+
+
+def test_middleware_registered_once():
+    """Test that the middleware stack is only configured once"""
+    assert [m.cls for m in app.user_middleware] == [CORSMiddleware]
+
+
+def test_routes_registered_once():
+    """Test that no method/path pair is registered twice"""
+    routes = Counter(
+        (method, route.path)
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+    )
+    duplicates = [key for key, count in routes.items() if count > 1]
+    assert duplicates == []
+
+
+def test_health_check(client):
+    """Test health check endpoint"""
+    response = client.get("/health")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"status": "healthy"}
+    assert response.headers["Cache-Control"] == "no-store"
+
+
+def test_cors_preflight(client):
+    """Test CORS preflight for an allowed origin and an unknown one"""
+    response = client.options(
+        "/api/v1/contracts/",
+        headers={
+            "Origin": "http://localhost:3000",
+            "Access-Control-Request-Method": "PUT",
+            "Access-Control-Request-Headers": "authorization,content-type",
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+
+    response = client.options(
+        "/api/v1/contracts/",
+        headers={
+            "Origin": "http://unknown.example.com",
+            "Access-Control-Request-Method": "PUT",
+        },
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -63,6 +63,18 @@ def test_list_templates(client, auth_headers, test_template):
     assert len(data) > 0
 
 
+def test_list_templates_with_cursor(client, auth_headers, test_template):
+    """Test keyset pagination of templates"""
+    response = client.get("/api/v1/templates/?limit=1", headers=auth_headers)
+    assert [t["id"] for t in response.json()] == [test_template.id]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(f"/api/v1/templates/?limit=1&cursor={cursor}", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
+
+
 def test_list_templates_with_category_filter(client, auth_headers, test_template):
     """Test listing templates with category filter"""
     response = client.get("/api/v1/templates/?category=NDA", headers=auth_headers)
@@ -100,6 +112,18 @@ def test_update_template_as_legal(client, legal_auth_headers, test_template):
     assert data["name"] == "Updated NDA Template"
 
 
+def test_template_reads_reflect_updates(client, auth_headers, legal_auth_headers, test_template):
+    """Test that cached template responses are invalidated by writes"""
+    url = f"/api/v1/templates/{test_template.id}"
+    assert client.get(url, headers=auth_headers).json()["name"] == "NDA Template"
+    assert client.get("/api/v1/templates/", headers=auth_headers).json()[0]["name"] == "NDA Template"
+
+    client.put(url, headers=legal_auth_headers, json={"name": "Mutual NDA"})
+
+    assert client.get(url, headers=auth_headers).json()["name"] == "Mutual NDA"
+    assert client.get("/api/v1/templates/", headers=auth_headers).json()[0]["name"] == "Mutual NDA"
+
+
 def test_update_template_as_non_legal(client, auth_headers, test_template):
     """Test updating template as non-legal user (should fail)"""
     response = client.put(
@@ -116,6 +140,34 @@ def test_delete_template_as_legal(client, legal_auth_headers, test_template):
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
 
+def test_delete_template_in_use(client, legal_auth_headers, auth_headers, test_template):
+    """Test deleting a template detaches the contracts created from it"""
+    response = client.post(
+        "/api/v1/contracts/",
+        headers=auth_headers,
+        json={
+            "title": "NDA with Acme",
+            "content": "Contract content here...",
+            "counterparty_name": "Acme Corp",
+            "template_id": test_template.id
+        }
+    )
+    contract_id = response.json()["id"]
+
+    response = client.delete(f"/api/v1/templates/{test_template.id}", headers=legal_auth_headers)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = client.get(f"/api/v1/contracts/{contract_id}", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["template_id"] is None
+
+
+def test_delete_nonexistent_template(client, legal_auth_headers):
+    """Test deleting nonexistent template"""
+    response = client.delete("/api/v1/templates/99999", headers=legal_auth_headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 def test_delete_template_as_non_legal(client, auth_headers, test_template):
     """Test deleting template as non-legal user (should fail)"""
     response = client.delete(f"/api/v1/templates/{test_template.id}", headers=auth_headers)
@@ -29,6 +29,18 @@ def test_list_users_as_admin(client, admin_auth_headers, test_user):
     assert len(data) > 0
 
 
+def test_list_users_with_cursor(client, admin_auth_headers, test_user):
+    """Test keyset pagination of users"""
+    response = client.get("/api/v1/users/?limit=1", headers=admin_auth_headers)
+    first_page = response.json()
+    cursor = response.headers["X-Next-Cursor"]
+    assert cursor == str(first_page[0]["id"])
+
+    response = client.get(f"/api/v1/users/?limit=1&cursor={cursor}", headers=admin_auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()[0]["id"] > first_page[0]["id"]
+
+
 def test_list_users_as_non_admin(client, auth_headers):
     """Test listing users as non-admin (should fail)"""
     response = client.get("/api/v1/users/", headers=auth_headers)
@@ -43,16 +55,19 @@ def test_get_user_by_id(client, auth_headers, test_user):
     assert data["id"] == test_user.id
 
 
-def test_get_other_user_as_non_admin(client, auth_headers, test_legal_user):
-    """Test getting other user's profile as non-admin (should fail)"""
-    response = client.get(f"/api/v1/users/{test_legal_user.id}", headers=auth_headers)
-    assert response.status_code == status.HTTP_403_FORBIDDEN
-
-
-def test_get_other_user_as_admin(client, admin_auth_headers, test_user):
-    """Test getting other user's profile as admin"""
-    response = client.get(f"/api/v1/users/{test_user.id}", headers=admin_auth_headers)
-    assert response.status_code == status.HTTP_200_OK
+@pytest.mark.parametrize(
+    "headers_fixture,expected_status",
+    [
+        ("auth_headers", status.HTTP_403_FORBIDDEN),
+        ("admin_auth_headers", status.HTTP_200_OK),
+    ],
+    ids=["non_admin", "admin"],
+)
+def test_get_other_user(client, request, headers_fixture, expected_status, test_legal_user):
+    """Test getting another user's profile (admins only)"""
+    headers = request.getfixturevalue(headers_fixture)
+    response = client.get(f"/api/v1/users/{test_legal_user.id}", headers=headers)
+    assert response.status_code == expected_status
 
 
 def test_update_own_profile(client, auth_headers, test_user):
@@ -92,19 +107,48 @@ def test_update_user_role_as_admin(client, admin_auth_headers, test_user):
     assert data["role"] == "legal"
 
 
-def test_delete_user_as_admin(client, admin_auth_headers, test_user):
-    """Test deleting user as admin"""
-    response = client.delete(f"/api/v1/users/{test_user.id}", headers=admin_auth_headers)
-    assert response.status_code == status.HTTP_204_NO_CONTENT
+def test_deactivated_user_loses_access(client, admin_auth_headers, auth_headers, test_user):
+    """Test deactivating a user takes effect despite the cached login"""
+    response = client.get("/api/v1/users/me", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
 
+    response = client.put(
+        f"/api/v1/users/{test_user.id}",
+        headers=admin_auth_headers,
+        json={"is_active": False}
+    )
+    assert response.status_code == status.HTTP_200_OK
 
-def test_delete_user_as_non_admin(client, auth_headers, test_legal_user):
-    """Test deleting user as non-admin (should fail)"""
-    response = client.delete(f"/api/v1/users/{test_legal_user.id}", headers=auth_headers)
+    response = client.get("/api/v1/users/me", headers=auth_headers)
     assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
+@pytest.mark.parametrize(
+    "headers_fixture,expected_status",
+    [
+        ("auth_headers", status.HTTP_403_FORBIDDEN),
+        ("admin_auth_headers", status.HTTP_204_NO_CONTENT),
+    ],
+    ids=["non_admin", "admin"],
+)
+def test_delete_user(client, request, headers_fixture, expected_status, test_legal_user):
+    """Test deleting another user (admins only)"""
+    headers = request.getfixturevalue(headers_fixture)
+    response = client.delete(f"/api/v1/users/{test_legal_user.id}", headers=headers)
+    assert response.status_code == expected_status
+
+
 def test_get_nonexistent_user(client, admin_auth_headers):
     """Test getting nonexistent user"""
     response = client.get("/api/v1/users/99999", headers=admin_auth_headers)
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_update_nonexistent_user(client, admin_auth_headers):
+    """Test updating nonexistent user"""
+    response = client.put(
+        "/api/v1/users/99999",
+        headers=admin_auth_headers,
+        json={"full_name": "Nobody"}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
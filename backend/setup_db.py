@@ -1,24 +1,57 @@
 #!/usr/bin/env python
 """
 Database setup script - creates database and tables
+
+A fresh database gets the current schema from the models and is stamped at the
+Alembic head, so later ``alembic upgrade head`` runs only apply newer revisions.
 """
 import sys
-from sqlalchemy import create_engine, text
-from sqlalchemy.exc import ProgrammingError
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
 from app.core.database import Base, engine
 from app.core.config import settings
-from app.models.user import User
-from app.models.contract import Contract
-from app.models.template import Template
+from app import models  # noqa: F401  (registers the tables on Base.metadata)
+
+BACKEND_DIR = Path(__file__).resolve().parent
+
+
+def stamp_alembic_head():
+    """Record the schema just created by create_all as the latest migration"""
+    cfg = Config(str(BACKEND_DIR / "alembic.ini"))
+    cfg.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    command.stamp(cfg, "head")
+
 
 def setup_database():
     """Create database and tables"""
     
     # Try to create tables
     try:
+        # One catalog query; create_all would otherwise check each table in turn
+        existing = set(inspect(engine).get_table_names())
+        missing = [t for t in Base.metadata.sorted_tables if t.name not in existing]
+        if not missing:
+            print("✓ Tables already exist")
+            return True
+
         print("Creating tables...")
-        Base.metadata.create_all(bind=engine)
+        # One transaction (and commit) for all of the DDL instead of one per statement.
+        # checkfirst stays on: metadata-level objects such as contract_number_seq are
+        # not covered by the tables filter and may already exist
+        with engine.begin() as conn:
+            Base.metadata.create_all(bind=conn, tables=missing)
         print("✓ Tables created successfully!")
+
+        if len(missing) < len(Base.metadata.tables):
+            # The existing tables may predate later revisions; stamping head would
+            # make Alembic skip migrations they still need
+            print("! Some tables already existed; Alembic was not stamped (see docs/SETUP.md)")
+        else:
+            stamp_alembic_head()
+            print("✓ Alembic stamped at head")
         return True
     except Exception as e:
         print(f"✗ Error creating tables: {e}")
@@ -1,15 +1,34 @@
 """
 Script to generate OpenAPI specification and save to /shared
 """
-import json
+import os
 import sys
+import tempfile
 from pathlib import Path
 
+import orjson
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
 from app.main import app
 
+def _write_atomic(path: Path, data: bytes):
+    """Write data to path so readers never see a partially written file"""
+    # A unique temp file per call, so concurrent generators never publish
+    # each other's half-written output
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False
+    ) as tmp:
+        tmp.write(data)
+    try:
+        # NamedTemporaryFile creates the file owner-only; keep the spec readable
+        os.chmod(tmp.name, 0o644)
+        os.replace(tmp.name, path)
+    finally:
+        if os.path.exists(tmp.name):
+            os.unlink(tmp.name)
+
 def generate_openapi_spec():
     """Generate OpenAPI specification and save to shared directory"""
     openapi_schema = app.openapi()
@@ -19,8 +38,9 @@ def generate_openapi_spec():
     shared_dir.mkdir(exist_ok=True)
 
     output_file = shared_dir / "openapi.json"
-    with open(output_file, "w") as f:
-        json.dump(openapi_schema, f, indent=2)
+    _write_atomic(output_file, orjson.dumps(openapi_schema, option=orjson.OPT_INDENT_2))
+    # Compact copy for tools that only parse the spec
+    _write_atomic(shared_dir / "openapi.min.json", orjson.dumps(openapi_schema))
 
     print(f"✓ OpenAPI specification generated: {output_file}")
     print(f"  Title: {openapi_schema.get('info', {}).get('title')}")